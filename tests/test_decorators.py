@@ -0,0 +1,97 @@
+import os
+import timeit
+import warnings
+from types import SimpleNamespace
+
+import pytest
+from pydantic import Field, ValidationError
+from typing_extensions import Annotated
+
+from vaul import tool_call
+
+ITERATIONS = 10_000
+
+
+def make_completion(name, arguments):
+    function = SimpleNamespace(name=name, arguments=arguments)
+    message = SimpleNamespace(tool_calls=[SimpleNamespace(function=function)])
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@tool_call
+def echo_number(a: int) -> int:
+    return a
+
+
+def test_from_response_preserves_big_integers():
+    completion = make_completion("echo_number", '{"a": 99999999999999999999}')
+    assert echo_number.from_response(completion) == 99999999999999999999
+
+
+@tool_call
+def add_numbers(a: int, b: int = 2, *args) -> int:
+    """Adds two numbers."""
+    return a + b
+
+
+def test_tool_call_schema():
+    assert add_numbers.tool_call_schema == {
+        "name": "add_numbers",
+        "description": "Adds two numbers.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "a": {"type": "integer"},
+                "b": {"type": "integer", "default": 2},
+            },
+            "required": ["a"],
+        },
+    }
+
+
+@tool_call
+def get_weather(
+    city: Annotated[str, Field(description="City name", examples=["Paris"])],
+    units: str = Field(default="c", description="c or f"),
+) -> str:
+    return f"{city}:{units}"
+
+
+def test_tool_call_schema_keeps_field_metadata():
+    properties = get_weather.tool_call_schema["parameters"]["properties"]
+    assert properties["city"] == {
+        "type": "string",
+        "description": "City name",
+        "examples": ["Paris"],
+    }
+    assert properties["units"] == {
+        "type": "string",
+        "default": "c",
+        "description": "c or f",
+    }
+    assert get_weather.tool_call_schema["parameters"]["required"] == ["city"]
+
+
+def test_call_validates_arguments():
+    assert add_numbers(a="1", b=2) == 3
+    with pytest.raises(ValidationError):
+        add_numbers(a=1, c=3)
+
+
+@pytest.mark.skipif(
+    not os.environ.get("VAUL_BENCHMARK"), reason="set VAUL_BENCHMARK=1 to run benchmarks"
+)
+def test_validate_func_faster_than_validate_arguments():
+    from pydantic import validate_arguments
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        legacy = validate_arguments(add_numbers.func)
+
+    current_time = min(
+        timeit.repeat(lambda: add_numbers(a=1, b="2"), number=ITERATIONS, repeat=3)
+    )
+    legacy_time = min(
+        timeit.repeat(lambda: legacy(a=1, b="2"), number=ITERATIONS, repeat=3)
+    )
+    assert current_time < legacy_time
@@ -0,0 +1,41 @@
+import pytest
+
+from vaul.utils import loads_json, remove_keys_recursively
+
+
+def test_remove_keys_recursively():
+    data = {"title": "F", "a": {"title": "A", "type": "integer"}, "b": [{"title": "B"}]}
+    result = remove_keys_recursively(data, ["title"])
+    assert result == {"a": {"type": "integer"}, "b": [{"title": "B"}]}
+
+
+def test_remove_keys_recursively_rejects_non_dict():
+    with pytest.raises(TypeError):
+        remove_keys_recursively([], "title")
+
+
+def test_remove_keys_recursively_shared_references():
+    shared = {"title": "S", "type": "string"}
+    result = remove_keys_recursively({"a": shared, "b": {"c": shared}}, "title")
+    assert result == {"a": {"type": "string"}, "b": {"c": {"type": "string"}}}
+
+
+def test_remove_keys_recursively_rejects_cycles():
+    data = {"a": {}}
+    data["a"]["b"] = data
+    with pytest.raises(ValueError):
+        remove_keys_recursively(data, "title")
+
+
+def test_loads_json_control_characters():
+    assert loads_json('{"a": "x\ty"}') == {"a": "x\ty"}
+
+
+def test_loads_json_preserves_big_integers():
+    result = loads_json('{"a": 99999999999999999999, "b": -123456789012345678901234}')
+    assert result == {"a": 99999999999999999999, "b": -123456789012345678901234}
+    assert isinstance(result["a"], int)
+
+
+def test_loads_json_preserves_negative_integers_below_int64():
+    assert loads_json('{"a": -9223372036854775809}') == {"a": -9223372036854775809}
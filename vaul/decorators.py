@@ -1,15 +1,67 @@
 from __future__ import annotations
 
+import inspect
 from functools import wraps
 from typing import Any, Callable, Dict
 
-from pydantic import validate_arguments
+from pydantic import TypeAdapter
+from pydantic.fields import FieldInfo
+from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
+from pydantic_core import ArgsKwargs, core_schema
+from typing_extensions import get_type_hints
 
 from .models import BaseTool
-from .utils import remove_keys_recursively
+from .utils import loads_json, remove_keys_recursively
 from .validation import validate_tool_call
 
 
+class _ToolCallJsonSchema(GenerateJsonSchema):
+    """
+    JSON schema generator that always describes a function's arguments as
+    a keyword object, leaving out variadic positional arguments.
+    """
+
+    def arguments_schema(self, schema: core_schema.ArgumentsSchema) -> JsonSchemaValue:
+        return self.kw_arguments_schema(
+            schema["arguments_schema"], schema.get("var_kwargs_schema")
+        )
+
+
+def _add_field_metadata(func: Callable, properties: Dict[str, Any]) -> None:
+    # The arguments schema only keeps Field constraints, so copy the
+    # descriptive metadata of each parameter into its property
+    hints = get_type_hints(func, include_extras=True)
+    for name, param in inspect.signature(func).parameters.items():
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+
+        annotation = hints.get(name, Any)
+        if param.default is param.empty:
+            field = FieldInfo.from_annotation(annotation)
+        else:
+            field = FieldInfo.from_annotated_attribute(annotation, param.default)
+
+        prop = properties.get(field.alias or name)
+        if prop is None:
+            continue
+        if field.description is not None:
+            prop["description"] = field.description
+        if field.examples is not None:
+            prop["examples"] = field.examples
+        if isinstance(field.json_schema_extra, dict):
+            prop.update(field.json_schema_extra)
+        elif callable(field.json_schema_extra):
+            field.json_schema_extra(prop)
+
+
+def _validate_arguments(func: Callable, adapter: TypeAdapter) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return adapter.validate_python(ArgsKwargs(args, kwargs))
+
+    return wrapper
+
+
 class ToolCall(BaseTool):
     """
     Decorator to convert a function into a tool call for an LLM.
@@ -34,6 +86,7 @@ class ToolCall(BaseTool):
     Attributes:
     - func: The function that is being decorated.
     - validate_func: A function that wraps the original function, adding Pydantic validation.
+      Invalid, unexpected or duplicated arguments raise pydantic.ValidationError.
     - tool_call_schema: The generated schema for the tool call.
 
     **INSPIRED BY JASON LIU'S EXCELLENT OPENAI_FUNCTION_CALL, NOW INSTRUCTOR, PACKAGE**
@@ -44,38 +97,32 @@ class ToolCall(BaseTool):
     def __init__(self, func: Callable) -> None:
         super().__init__()
         self.func = func
-        self.validate_func = validate_arguments(func)
+        self._name = func.__name__
+        self._adapter = TypeAdapter(func)
+        self.validate_func = _validate_arguments(func, self._adapter)
         self.tool_call_schema = self._generate_tool_call_schema()
 
     def _generate_tool_call_schema(self) -> Dict[str, Any]:
-        schema = self.validate_func.model.model_json_schema()
-        relevant_properties = {
-            k: v
-            for k, v in schema["properties"].items()
-            if k not in ("v__duplicate_kwargs", "args", "kwargs")
-        }
-        schema["properties"] = relevant_properties
+        schema = self._adapter.json_schema(schema_generator=_ToolCallJsonSchema)
+        _add_field_metadata(self.func, schema["properties"])
 
-        # Update the required field to allow empty arguments
-        schema["required"] = sorted(
-            k for k, v in relevant_properties.items() if v.get("default", None) is None
-        ) if relevant_properties else []
+        # required lists the parameters without a default, sorted
+        required = [
+            k for k, v in schema["properties"].items() if v.get("default", None) is None
+        ]
+        required.sort()
+        schema["required"] = required
 
-        schema = remove_keys_recursively(schema, "additionalProperties")
-        schema = remove_keys_recursively(schema, "title")
+        schema = remove_keys_recursively(schema, ["additionalProperties", "title"])
 
         return {
-            "name": self.func.__name__,
+            "name": self._name,
             "description": self.func.__doc__,
             "parameters": schema,
         }
 
     def __call__(self, *args, **kwargs) -> Any:
-        @wraps(self.func)
-        def wrapper(*args, **kwargs):
-            return self.validate_func(*args, **kwargs)
-
-        return wrapper(*args, **kwargs)
+        return self.validate_func(*args, **kwargs)
 
     def _validate_tool_call(
         self, message: Dict[str, Any], throw_error: bool = True
@@ -83,20 +130,15 @@ class ToolCall(BaseTool):
         return validate_tool_call(message, self.tool_call_schema, throw_error)
 
     def from_response(self, completion: Any, throw_error: bool = True) -> Any:
-        import json
+        message = completion.choices[0].message
+        if throw_error:
+            assert message.tool_calls, "No tool call detected"
 
-        message = completion.choices[0].message.model_dump(exclude_unset=True)
+        function = message.tool_calls[0].function
         if throw_error:
-            assert "tool_calls" in message, "No tool call detected"
-            assert (
-                message["tool_calls"][0]["function"]["name"] == self.func.__name__
-            ), "Function name does not match"
-
-        return self.validate_func(
-            **json.loads(
-                message["tool_calls"][0]["function"]["arguments"], strict=False
-            )
-        )
+            assert function.name == self._name, "Function name does not match"
+
+        return self.validate_func(**loads_json(function.arguments))
 
     def run(self, arguments: Dict[str, Any]) -> Any:
         return self.func(**arguments)
@@ -1,3 +1,4 @@
+import json
 from typing import Any, Dict, List, Union
 
 
@@ -15,19 +16,59 @@ def remove_keys_recursively(
 
     Raises:
     - TypeError: If the input is not a dictionary.
+    - ValueError: If the input contains circular references.
     """
 
     # Error handling
     if not isinstance(d, dict):
         raise TypeError("Input should be a dictionary.")
 
-    # Make keys_to_remove a list if it's a single string
+    # Normalize keys_to_remove to a set for constant-time membership checks
     if isinstance(keys_to_remove, str):
-        keys_to_remove = [keys_to_remove]
+        keys_to_remove = frozenset((keys_to_remove,))
+    else:
+        keys_to_remove = frozenset(keys_to_remove)
 
+    # Walk nested dictionaries with an explicit stack instead of recursion,
+    # tracking the dictionaries on the current path to detect cycles
     new_dict = {}
-    for k, v in d.items():
-        if k not in keys_to_remove:
-            new_dict[k] = remove_keys_recursively(v, keys_to_remove) if isinstance(v, dict) else v
+    active = set()
+    stack = [(d, new_dict)]
+    while stack:
+        source, target = stack.pop()
+        if source is None:
+            active.discard(target)
+            continue
+        if id(source) in active:
+            raise ValueError("Input should not contain circular references.")
+        active.add(id(source))
+        stack.append((None, id(source)))
+
+        for k, v in source.items():
+            if k in keys_to_remove:
+                continue
+            if isinstance(v, dict):
+                target[k] = {}
+                stack.append((v, target[k]))
+            else:
+                target[k] = v
 
     return new_dict
+
+
+def loads_json(data: str) -> Any:
+    """
+    Parses a JSON string such as the arguments of a tool call.
+
+    Parsing is non-strict, so control characters inside strings are
+    accepted, and integers of any size are kept exact.
+
+    Parameters:
+    - data (str): The JSON string to parse.
+    Returns:
+    Any: The parsed JSON value.
+
+    Raises:
+    - json.JSONDecodeError: If the input is not valid JSON.
+    """
+    return json.loads(data, strict=False)